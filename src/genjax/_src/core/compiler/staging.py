@@ -34,6 +34,7 @@ from genjax._src.core.typing import (
     Callable,
     Flag,
     Iterable,
+    PRNGKey,
     Sequence,
     TypeVar,
     static_check_is_concrete,
@@ -61,6 +62,10 @@ class FlagOp:
     code size for the result by not including the code for the branch that cannot be taken.
 
     This class centralizes the concrete short-cut logic used by GenJAX.
+
+    When only one operand of a binary operation is concrete and it is the identity
+    for that operation (`True` for `and_`, `False` for `or_` and `xor_`), the other
+    operand is returned as-is rather than staged through a `jnp.logical_*` call.
     """
 
     @staticmethod
@@ -93,6 +98,10 @@ class FlagOp:
     def and_(f: Flag, g: Flag) -> Flag:
         if isinstance(f, bool) and isinstance(g, bool):
             return f & g
+        elif f is True:
+            return g
+        elif g is True:
+            return f
         else:
             return jnp.logical_and(f, g)
 
@@ -112,6 +121,10 @@ class FlagOp:
     def or_(f: Flag, g: Flag) -> Flag:
         if isinstance(f, bool) and isinstance(g, bool):
             return f | g
+        elif f is False:
+            return g
+        elif g is False:
+            return f
         else:
             return jnp.logical_or(f, g)
 
@@ -131,6 +144,10 @@ class FlagOp:
     def xor_(f: Flag, g: Flag) -> Flag:
         if isinstance(f, bool) and isinstance(g, bool):
             return f ^ g
+        elif f is False:
+            return g
+        elif g is False:
+            return f
         else:
             return jnp.logical_xor(f, g)
 
@@ -164,7 +181,7 @@ class FlagOp:
     def where(f: Flag, tf: ArrayLike, ff: ArrayLike) -> ArrayLike:
         """Return tf or ff according to the truth value contained in flag
         in a manner that works in either the concrete or dynamic context"""
-        if f is True:
+        if f is True or tf is ff:
             return tf
         if f is False:
             return ff
@@ -173,7 +190,7 @@ class FlagOp:
     @staticmethod
     def cond(f: Flag, tf: Callable[..., R], ff: Callable[..., R], *args: Any) -> R:
         """Invokes `tf` with `args` if flag is true, else `ff`"""
-        if f is True:
+        if f is True or tf is ff:
             return tf(*args)
         if f is False:
             return ff(*args)
@@ -205,15 +222,17 @@ def tree_choose(
     """
 
     def inner(*vs: ArrayLike) -> ArrayLike:
-        # Computing `result` above the branch allows us to:
-        # - catch incompatible types / shapes in the result
-        # - in the case of compatible types requiring casts (like bool => int),
-        #   result's dtype tells us the final type.
-        result = jnp.choose(idx, vs, mode="wrap")
         if isinstance(idx, int):
-            return jnp.asarray(vs[idx % len(vs)], dtype=result.dtype)
+            # Resolving the shapes and dtype directly (rather than staging a
+            # `jnp.choose` and discarding it) still allows us to:
+            # - catch incompatible types / shapes among the candidates
+            # - in the case of compatible types requiring casts (like bool => int),
+            #   find the final type.
+            jnp.broadcast_shapes(*(jnp.shape(v) for v in vs))
+            dtype = jnp.result_type(*vs)
+            return jnp.asarray(vs[idx % len(vs)], dtype=dtype)
         else:
-            return result
+            return jnp.choose(idx, vs, mode="wrap")
 
     return jtu.tree_map(inner, *pytrees)
 
@@ -326,7 +345,10 @@ def to_shape_fn(
     return typing.cast(F, wrapped)
 
 
-_fake_key = jnp.array([0, 0], dtype=jnp.uint32)
+# Only the shape and dtype of the key are seen by `jax.eval_shape`, so an abstract
+# value avoids materializing a device buffer at import time. It stands in for a
+# `PRNGKey` in the traced calls, hence the cast.
+_fake_key = typing.cast(PRNGKey, jax.ShapeDtypeStruct((2,), jnp.uint32))
 
 
 def empty_trace(
@@ -23,6 +23,7 @@ import jax.tree_util as jtu
 import treescope.repr_lib as trl
 from deprecated import deprecated
 
+from genjax._src.core.compiler.staging import FlagOp, tree_choose
 from genjax._src.core.generative.functional_types import Mask
 from genjax._src.core.pytree import Pytree
 from genjax._src.core.typing import (
@@ -37,6 +38,7 @@ from genjax._src.core.typing import (
     Iterable,
     TypeVar,
     nobeartype,
+    static_check_is_concrete,
 )
 
 if TYPE_CHECKING:
@@ -111,10 +113,19 @@ class _SelectionBuilder:
 
     def __getitem__(self, addr: ExtendedStaticAddress) -> "Selection":
         addr = addr if isinstance(addr, tuple) else (addr,)
-        if addr == ():
-            return Selection.leaf()
-        else:
-            return Selection.all().extend(*addr)
+        return _build_static_selection(addr)
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_static_selection(
+    addr: tuple[ExtendedStaticAddressComponent, ...],
+) -> "Selection":
+    # Selections built from static addresses are immutable and hold no arrays,
+    # so the selection for a given address can be built once and shared.
+    if addr == ():
+        return Selection.leaf()
+    else:
+        return Selection.all().extend(*addr)
 
 
 SelectionBuilder = _SelectionBuilder()
@@ -216,7 +227,7 @@ class Selection(Pytree):
             assert all_selection["any_address"] == True
             ```
         """
-        return AllSel()
+        return _all_sel
 
     @staticmethod
     def none() -> "Selection":
@@ -232,7 +243,7 @@ class Selection(Pytree):
             assert none_selection["any_address"] == False
             ```
         """
-        return NoneSel()
+        return _none_sel
 
     @staticmethod
     def leaf() -> "Selection":
@@ -252,7 +263,7 @@ class Selection(Pytree):
             assert not leaf_selection["a", "b", "anything"]
             ```
         """
-        return LeafSel()
+        return _leaf_sel
 
     ######################
     # Combinator methods #
@@ -324,22 +335,43 @@ class Selection(Pytree):
             acc = StaticSel.build(acc, addr)
         return acc
 
+    # The dunders below are the hot entry points for lookups, so they skip
+    # runtime type checking; `__call__` checks the address components itself
+    # before walking them.
+
+    @nobeartype
     def __call__(
         self,
         addr: StaticAddress,
     ) -> "Selection":
-        addr = addr if isinstance(addr, tuple) else (addr,)
+        # Checked up front, since the walk below may stop before reaching every
+        # component. The components are typed as `object` because callers can
+        # pass anything here once type checking is skipped.
+        comps: tuple[object, ...] = addr if isinstance(addr, tuple) else (addr,)
+        path: list[StaticAddressComponent] = []
+        for comp in comps:
+            if not isinstance(comp, StaticAddressComponent):
+                raise TypeError(
+                    f"Selection addresses must be made of strings, got {comp!r} in {comps!r}."
+                )
+            path.append(comp)
         subselection = self
-        for comp in addr:
+        for comp in path:
+            # `AllSel` and `NoneSel` are fixed points of `get_subselection`, so
+            # the rest of the address can't change the result.
+            if isinstance(subselection, (AllSel, NoneSel)):
+                break
             subselection = subselection.get_subselection(comp)
         return subselection
 
+    @nobeartype
     def __getitem__(
         self,
         addr: StaticAddress,
     ) -> bool:
         return self(addr).check()
 
+    @nobeartype
     def __contains__(
         self,
         addr: StaticAddress,
@@ -470,7 +502,7 @@ class ComplementSel(Selection):
         return not self.s.check()
 
     def get_subselection(self, addr: StaticAddressComponent) -> Selection:
-        remaining = self.s(addr)
+        remaining = self.s.get_subselection(addr)
         return ~remaining
 
 
@@ -496,7 +528,7 @@ class StaticSel(Selection):
     """
 
     s: Selection = Pytree.field()
-    addr: ExtendedStaticAddressComponent = Pytree.static()
+    addr: StaticAddressComponent = Pytree.static()
 
     @staticmethod
     def build(
@@ -506,6 +538,8 @@ class StaticSel(Selection):
         match s:
             case NoneSel():
                 return s
+            case _ if isinstance(addr, EllipsisType):
+                return WildcardSel(s)
             case _:
                 return StaticSel(s, addr)
 
@@ -513,15 +547,92 @@ class StaticSel(Selection):
         return False
 
     def get_subselection(self, addr: StaticAddressComponent) -> Selection:
-        if isinstance(self.addr, EllipsisType):
-            return self.s
-
         if addr == self.addr:
             return self.s
         else:
             return Selection.none()
 
 
+@Pytree.dataclass(match_args=True)
+class WildcardSel(Selection):
+    """Represents a selection that applies its underlying selection under any address component.
+
+    This is what `...` builds in a selection address: every lookup passes straight through to the underlying selection, without comparing address components.
+
+    Attributes:
+        s: The underlying selection applied under every address.
+
+    Examples:
+        ```python exec="yes" html="true" source="material-block" session="choicemap"
+        wildcard_sel = Selection.at[..., "y"]
+        assert wildcard_sel.check() == False
+        assert wildcard_sel["x", "y"] == True
+        assert wildcard_sel["z", "y"] == True
+        assert wildcard_sel["x", "z"] == False
+        ```
+    """
+
+    s: Selection
+
+    def check(self) -> bool:
+        return False
+
+    def get_subselection(self, addr: StaticAddressComponent) -> Selection:
+        return self.s
+
+
+@Pytree.dataclass(match_args=True)
+class DictSel(Selection):
+    """Represents a selection that dispatches on a static address component with a single dictionary lookup.
+
+    This is the n-ary form of `StaticSel`: ORing together selections nested under distinct static addresses produces one `DictSel`, rather than a chain of `OrSel` nodes that every lookup would have to walk.
+
+    Attributes:
+        mapping: A dictionary mapping static address components to the selection applied under them.
+
+    Examples:
+        ```python exec="yes" html="true" source="material-block" session="choicemap"
+        sel = Selection.at["x"] | Selection.at["y", "z"]
+        assert sel["x"] == True
+        assert sel["y", "z"] == True
+        assert sel["w"] == False
+        ```
+    """
+
+    mapping: dict[StaticAddressComponent, Selection]
+
+    @staticmethod
+    def build(mapping: dict[StaticAddressComponent, Selection]) -> Selection:
+        mapping = {k: v for k, v in mapping.items() if not isinstance(v, NoneSel)}
+        match len(mapping):
+            case 0:
+                return Selection.none()
+            case 1:
+                [(addr, s)] = mapping.items()
+                return StaticSel(s, addr)
+            case _:
+                return DictSel(mapping)
+
+    @staticmethod
+    def static_mapping(s: Selection) -> dict[StaticAddressComponent, Selection] | None:
+        """
+        Returns the selection as a mapping from static address components to subselections, or None if it can't be written that way.
+        """
+        match s:
+            case DictSel(mapping):
+                return mapping
+            case StaticSel(inner, addr):
+                return {addr: inner}
+            case _:
+                return None
+
+    def check(self) -> bool:
+        return False
+
+    def get_subselection(self, addr: StaticAddressComponent) -> Selection:
+        return self.mapping.get(addr, Selection.none())
+
+
 @Pytree.dataclass(match_args=True)
 class AndSel(Selection):
     """Represents a selection that combines two other selections using a logical AND operation.
@@ -560,6 +671,10 @@ class AndSel(Selection):
                 return b
             case (a, b) if a == b:
                 return a
+            case (ComplementSel(s), _) if s == b:
+                return Selection.none()
+            case (_, ComplementSel(s)) if s == a:
+                return Selection.none()
             case _:
                 return AndSel(a, b)
 
@@ -567,8 +682,8 @@ class AndSel(Selection):
         return self.s1.check() and self.s2.check()
 
     def get_subselection(self, addr: StaticAddressComponent) -> Selection:
-        remaining1 = self.s1(addr)
-        remaining2 = self.s2(addr)
+        remaining1 = self.s1.get_subselection(addr)
+        remaining2 = self.s2.get_subselection(addr)
         return remaining1 & remaining2
 
 
@@ -612,15 +727,28 @@ class OrSel(Selection):
                 return a
             case (a, b) if a == b:
                 return a
+            case (ComplementSel(s), _) if s == b:
+                return Selection.all()
+            case (_, ComplementSel(s)) if s == a:
+                return Selection.all()
             case _:
-                return OrSel(a, b)
+                m1, m2 = DictSel.static_mapping(a), DictSel.static_mapping(b)
+                if m1 is None or m2 is None:
+                    return OrSel(a, b)
+
+                # Both sides dispatch on static address components, so the
+                # union can too.
+                merged = dict(m1)
+                for addr, s in m2.items():
+                    merged[addr] = merged[addr] | s if addr in merged else s
+                return DictSel.build(merged)
 
     def check(self) -> bool:
         return self.s1.check() or self.s2.check()
 
     def get_subselection(self, addr: StaticAddressComponent) -> Selection:
-        remaining1 = self.s1(addr)
-        remaining2 = self.s2(addr)
+        remaining1 = self.s1.get_subselection(addr)
+        remaining2 = self.s2.get_subselection(addr)
         return remaining1 | remaining2
 
 
@@ -663,6 +791,12 @@ class ChmSel(Selection):
         return submap.get_selection()
 
 
+# `AllSel`, `NoneSel` and `LeafSel` carry no data, so every `Selection.all()` /
+# `Selection.none()` / `Selection.leaf()` shares a single instance.
+_all_sel = AllSel()
+_none_sel = NoneSel()
+_leaf_sel = LeafSel()
+
 ###############
 # Choice maps #
 ###############
@@ -938,6 +1072,7 @@ class ChoiceMap(Pytree):
     ) -> "ChoiceMap":
         pass
 
+    @nobeartype
     def get_submap(self, *addresses: Address) -> "ChoiceMap":
         addr = tuple(
             label for a in addresses for label in (a if isinstance(a, tuple) else (a,))
@@ -945,8 +1080,19 @@ class ChoiceMap(Pytree):
         addr: tuple[AddressComponent, ...] = _validate_addr(
             addr, allow_partial_slice=True
         )
-        return functools.reduce(lambda chm, addr: chm.get_inner_map(addr), addr, self)
+        return self._get_submap_path(addr)
+
+    @nobeartype
+    def _get_submap_path(self, addr: tuple[AddressComponent, ...]) -> "ChoiceMap":
+        chm = self
+        for comp in addr:
+            # Every submap of an empty choice map is empty.
+            if chm.static_is_empty():
+                break
+            chm = chm.get_inner_map(comp)
+        return chm
 
+    @nobeartype
     def has_value(self) -> bool:
         return self.get_value() is not None
 
@@ -1077,13 +1223,13 @@ class ChoiceMap(Pytree):
         Note:
             If multiple pairs have the same address, later pairs will overwrite earlier ones.
         """
-        acc = ChoiceMap.empty()
+        entries: list[ChoiceMap] = []
 
         for addr, v in pairs:
             addr = addr if isinstance(addr, tuple) else (addr,)
-            acc |= ChoiceMap.entry(v, *addr)
+            entries.append(ChoiceMap.entry(v, *addr))
 
-        return acc
+        return Or.build_n(*entries)
 
     @staticmethod
     def d(d: dict[K_addr, Any]) -> "ChoiceMap":
@@ -1109,7 +1255,14 @@ class ChoiceMap(Pytree):
             assert dict_chm["y", "z"] == [1, 2, 3]
             ```
         """
-        return ChoiceMap.from_mapping(d.items())
+        # Distinct static keys never overlap, so when every key is static the
+        # entries can go straight into a single `Static` node.
+        static: dict[StaticAddressComponent, ChoiceMap] = {}
+        for k, v in d.items():
+            if not isinstance(k, StaticAddressComponent):
+                return ChoiceMap.from_mapping(d.items())
+            static[k] = ChoiceMap.entry(v)
+        return Static.build(static)
 
     @staticmethod
     def kw(**kwargs) -> "ChoiceMap":
@@ -1192,7 +1345,14 @@ class ChoiceMap(Pytree):
             assert masked_chm.get_value() is None
             ```
         """
-        return self.filter(flag)
+        # Concrete flags are resolved here, rather than by pushing them down to
+        # (and rebuilding) every leaf.
+        if FlagOp.concrete_true(flag):
+            return self
+        elif FlagOp.concrete_false(flag):
+            return ChoiceMap.empty()
+        else:
+            return self.filter(flag)
 
     def extend(self, *addrs: AddressComponent) -> "ChoiceMap":
         """
@@ -1298,6 +1458,10 @@ class ChoiceMap(Pytree):
     def __add__(self, other: "ChoiceMap") -> "ChoiceMap":
         return self | other
 
+    # As for `Selection`, the lookup dunders skip runtime type checking and
+    # leave address validation to `get_submap`.
+
+    @nobeartype
     def __call__(
         self,
         *addresses: Address,
@@ -1305,6 +1469,7 @@ class ChoiceMap(Pytree):
         """Alias for `get_submap(*addresses)`."""
         return self.get_submap(*addresses)
 
+    @nobeartype
     def __getitem__(
         self,
         addr: Address,
@@ -1316,6 +1481,7 @@ class ChoiceMap(Pytree):
         else:
             return v
 
+    @nobeartype
     def __contains__(
         self,
         addr: Address,
@@ -1492,6 +1658,50 @@ class Indexed(ChoiceMap):
         else:
             return Indexed(chm, addr)
 
+    @staticmethod
+    def stack(c1: "Indexed", c2: "Indexed") -> "Indexed | None":
+        """
+        Returns a single `Indexed` holding the entries of both `c1` and `c2` in one address array (with `c1`'s entries first, so that they keep priority on lookup), or None if the two can't be stacked.
+
+        Stacking requires both choice maps to hold plain, concrete array `Choice` leaves of the same dtype and element shape under concrete array addresses, as produced by e.g. `jax.vmap(lambda idx, v: C["x", idx].set(v))` outside of any transformation. Each leaf must have exactly one entry per address: a scalar under a 0-d address, or a leading dimension matching the length of a 1-d address. Anything else is left to `Or`, which resolves lookups without reshaping the leaves.
+
+        Traced operands are never stacked: inside `jax.vmap`, an address that looks 0-d in the body is batched once vmap returns, so ranks seen at trace time don't describe the final layout.
+        """
+
+        def entries(chm: Indexed) -> tuple[Array, Array] | None:
+            match chm.c, chm.addr:
+                case Choice(v), Array() as addr if (
+                    isinstance(v, Array)
+                    and static_check_is_concrete(v)
+                    and static_check_is_concrete(addr)
+                ):
+                    if addr.ndim == 0 and v.ndim == 0:
+                        return v[None], addr[None]
+                    elif (
+                        addr.ndim == 1
+                        and v.ndim >= 1
+                        and v.shape[0] == addr.shape[0]
+                    ):
+                        return v, addr
+                    else:
+                        return None
+
+                case _:
+                    return None
+
+        e1, e2 = entries(c1), entries(c2)
+        if e1 is None or e2 is None:
+            return None
+
+        (v1, addr1), (v2, addr2) = e1, e2
+        if v1.shape[1:] != v2.shape[1:] or v1.dtype != v2.dtype:
+            return None
+
+        return Indexed(
+            Choice(jnp.concatenate([v1, v2])),
+            jnp.concatenate([addr1, addr2]),
+        )
+
     def filter(self, selection: Selection | Flag) -> ChoiceMap:
         return self.c.filter(selection).extend(self.addr)
 
@@ -1505,7 +1715,7 @@ class Indexed(ChoiceMap):
         else:
             if not isinstance(addr, slice):
                 # If we allowed non-scalar addresses, the `get_submap` call would not reduce the leaf by a dimension, and further get_submap calls would target the same dimension.
-                assert not jnp.asarray(addr, copy=False).shape, (
+                assert jnp.ndim(addr) == 0, (
                     "Only scalar dynamic addresses are supported by get_submap."
                 )
 
@@ -1519,10 +1729,12 @@ class Indexed(ChoiceMap):
 
                 # If `check` contains a match (we know it will be a single match, since we constrain addr to be scalar), then `idx` is the index of the match in `self.addr`.
                 # Else, idx == 0 (selecting "junk data" of the right shape at the leaf) and check_array[idx] == False (masking the junk data).
-                idx = jnp.argwhere(check, size=1, fill_value=0)[0, 0]
+                # `argmax` on booleans returns the first True index (or 0), as a single reduction rather than `argwhere`'s sized nonzero search.
+                idx = jnp.argmax(check)
+                flag = check[idx]
 
                 return jtu.tree_map(
-                    lambda v: Mask.build(v[idx], check[idx]),
+                    lambda v: Mask.build(v[idx], flag),
                     self.c,
                     is_leaf=lambda x: isinstance(x, Mask),
                 )
@@ -1552,10 +1764,9 @@ class Static(ChoiceMap):
             else:
                 return d
 
-        return Static(
-            # Filter out empty choice maps
-            {k: unwrap(v) for k, v in d.items() if not v.static_is_empty()}
-        )
+        # Filter out empty choice maps
+        mapping = {k: unwrap(v) for k, v in d.items() if not v.static_is_empty()}
+        return Static(mapping) if mapping else _empty
 
     @staticmethod
     def merge_with(
@@ -1575,20 +1786,62 @@ class Static(ChoiceMap):
             ChoiceMap: A new ChoiceMap resulting from merging c1 and c2 using the
             provided merge function.
         """
+        # Entries that only appear on one side are shared as-is; only the
+        # overlapping keys are merged and re-wrapped.
+        merged_dict = dict(c1.mapping)
+        for key, v in c2.mapping.items():
+            if key not in merged_dict:
+                merged_dict[key] = v
+                continue
+
+            merged = merge(c1.get_inner_map(key), c2.get_inner_map(key))
+            if merged.static_is_empty():
+                del merged_dict[key]
+            elif isinstance(merged, Static):
+                merged_dict[key] = merged.mapping
+            else:
+                merged_dict[key] = merged
+        return Static(merged_dict) if merged_dict else _empty
+
+    @staticmethod
+    def merge_n(
+        merge: Callable[..., ChoiceMap],
+        *cs: "Static",
+    ) -> ChoiceMap:
+        """
+        Returns a new ChoiceMap generated by merging any number of Static instances in a single pass. Keys that appear in only one input are shared as-is; the values under keys that appear in several inputs are merged by a single call to `merge`, in input order.
+
+        Args:
+            merge: A variadic function that defines how to merge the ChoiceMaps that share a key.
+            cs: The Static instances to merge.
+
+        Returns:
+            ChoiceMap: A new ChoiceMap resulting from merging all of `cs`.
+        """
+        grouped: dict[StaticAddressComponent, list[Any]] = {}
+        for c in cs:
+            for key, v in c.mapping.items():
+                grouped.setdefault(key, []).append(v)
+
         merged_dict = {}
-        for key in set(c1.mapping.keys()) | set(c2.mapping.keys()):
-            if key in c1.mapping and key in c2.mapping:
-                merged_dict[key] = merge(c1.get_submap(key), c2.get_submap(key))
-            elif key in c1.mapping:
-                merged_dict[key] = c1.get_submap(key)
+        for key, vs in grouped.items():
+            if len(vs) == 1:
+                merged_dict[key] = vs[0]
+                continue
+
+            merged = merge(*(Static(v) if isinstance(v, dict) else v for v in vs))
+            if merged.static_is_empty():
+                continue
+            elif isinstance(merged, Static):
+                merged_dict[key] = merged.mapping
             else:
-                merged_dict[key] = c2.get_submap(key)
-        return Static.build(merged_dict)
+                merged_dict[key] = merged
+        return Static(merged_dict) if merged_dict else _empty
 
     def filter(self, selection: Selection | Flag) -> ChoiceMap:
         def to_subsel(addr: StaticAddressComponent) -> Selection | Flag:
             if isinstance(selection, Selection):
-                return selection(addr)
+                return selection.get_subselection(addr)
             else:
                 return selection
 
@@ -1602,13 +1855,32 @@ class Static(ChoiceMap):
 
     def get_inner_map(self, addr: AddressComponent) -> ChoiceMap:
         if isinstance(addr, StaticAddressComponent):
-            v = self.mapping.get(addr, {})
+            v = self.mapping.get(addr)
+            if v is None:
+                return _empty
             return Static(v) if isinstance(v, dict) else v
         else:
             return jtu.tree_map(
                 lambda v: v[addr], self, is_leaf=lambda x: isinstance(x, Mask)
             )
 
+    @nobeartype
+    def _get_submap_path(self, addr: tuple[AddressComponent, ...]) -> ChoiceMap:
+        # Walk leading static components directly through the nested dicts,
+        # rather than wrapping every intermediate level in a fresh `Static`.
+        node = self.mapping
+        for i, comp in enumerate(addr):
+            if not isinstance(comp, StaticAddressComponent):
+                chm = self if node is self.mapping else Static(node)
+                return chm.get_inner_map(comp)._get_submap_path(addr[i + 1 :])
+            v = node.get(comp)
+            if v is None:
+                return _empty
+            elif not isinstance(v, dict):
+                return v._get_submap_path(addr[i + 1 :])
+            node = v
+        return self if node is self.mapping else Static(node)
+
     def static_is_empty(self) -> bool:
         return len(self.mapping) == 0
 
@@ -1662,7 +1934,19 @@ class Switch(ChoiceMap):
         vs = [chm.get_value() for chm in self.chms]
         entries = [Mask.build(v) for v in vs if v is not None]
 
-        return Mask.or_n(*entries) if entries else None
+        if not entries:
+            return None
+
+        if len(entries) == len(self.chms) and jnp.ndim(self.idx) == 0:
+            # Every branch holds a value, and each branch's flag includes
+            # `_idx == idx`, so only the branch at `idx` can be valid: select it
+            # directly with one n-ary choose instead of N - 1 pairwise ORs.
+            head, *tail = entries
+            for entry in tail:
+                head.validate_mask_shapes(entry)
+            return tree_choose(self.idx, entries)
+
+        return Mask.or_n(*entries)
 
     def get_inner_map(self, addr: AddressComponent) -> ChoiceMap:
         return Switch(self.idx, [chm.get_inner_map(addr) for chm in self.chms])
@@ -1729,9 +2013,24 @@ class Or(ChoiceMap):
                 case (Choice(), _) | (_, Choice()):
                     raise Exception(f"Choice and non-Choice in Or: {c1}, {c2}")
 
+                case (Indexed(), Indexed()):
+                    stacked = Indexed.stack(c1, c2)
+                    return Or(c1, c2) if stacked is None else stacked
+
                 case _:
                     return Or(c1, c2)
 
+    @staticmethod
+    def build_n(*chms: ChoiceMap) -> ChoiceMap:
+        """
+        N-ary version of `Or.build`, with earlier choice maps taking priority. Collections of `Static` choice maps are merged in a single pass rather than by folding `|`, which would copy the accumulated mapping once per entry.
+        """
+        statics = [chm for chm in chms if isinstance(chm, Static)]
+        if len(statics) == len(chms):
+            return Static.merge_n(Or.build_n, *statics)
+        else:
+            return _pairwise_reduce(Or.build, list(chms), ChoiceMap.empty())
+
     def filter(self, selection: Selection | Flag) -> ChoiceMap:
         return self.c1.filter(selection) | self.c2.filter(selection)
 
@@ -1744,33 +2043,43 @@ class Or(ChoiceMap):
         return submap1 | submap2
 
 
+def _pairwise_reduce(f: Callable[[T, T], T], xs: list[T], empty: T) -> T:
+    """
+    Reduces `xs` with the associative `f` as a balanced binary tree, preserving the order of the operands, so that the result has depth O(log N) rather than the O(N) of a left fold.
+    """
+    if not xs:
+        return empty
+
+    while len(xs) > 1:
+        paired = [f(a, b) for a, b in zip(xs[::2], xs[1::2])]
+        if len(xs) % 2:
+            paired.append(xs[-1])
+        xs = paired
+    return xs[0]
+
+
 def _shape_selection(chm: ChoiceMap) -> Selection:
     def loop(inner: ChoiceMap, selection: Selection) -> Selection:
         match inner:
             case Static(mapping):
-                acc = Selection.none()
-                for addr in mapping.keys():
-                    sub_chm = inner.get_submap(addr)
-                    sub_sel = selection(addr)
-                    acc |= loop(sub_chm, sub_sel).extend(addr)
-                return acc
-
-            case Indexed(c, addr):
+                return DictSel.build({
+                    addr: loop(inner.get_submap(addr), selection(addr))
+                    for addr in mapping.keys()
+                })
+
+            case Indexed(c, _):
                 return loop(c, selection).extend(...)
 
             case Choice():
-                return LeafSel()
+                return _leaf_sel
 
             case Or(c1, c2):
                 return loop(c1, selection) | loop(c2, selection)
 
             case Switch(_, chms):
-                head, tail = chms[0], chms[1:]
-                acc = loop(head, selection)
-                for chm in tail:
-                    acc |= loop(chm, selection)
-
-                return acc
+                return _pairwise_reduce(
+                    or_, [loop(chm, selection) for chm in chms], Selection.none()
+                )
 
             case _:
                 raise ValueError(f"Unknown ChoiceMap type: {type(inner)}")
@@ -133,8 +133,8 @@ class Mask(Generic[R], Pytree):
 
         jtu.tree_map(check_leaf_shapes, this, other)
 
-    def _validate_mask_shapes(self, other: "Mask[R]") -> None:
-        """Used by __or__, __xor__ etc. to ensure we only combine masks with matching pytree shape and matching leaf shapes."""
+    def validate_mask_shapes(self, other: "Mask[R]") -> None:
+        """Used by __or__, __xor__ etc. (and by choice maps that select between masks directly) to ensure we only combine masks with matching pytree shape and matching leaf shapes."""
         if jtu.tree_structure(self.value) != jtu.tree_structure(other.value):
             raise ValueError("Cannot combine masks with different tree structures!")
 
@@ -164,6 +164,10 @@ class Mask(Generic[R], Pytree):
                 assert FlagOp.is_scalar(f) or (jnp.shape(f) == jnp.shape(g)), (
                     f"Can't build a Mask with non-matching Flag shapes {jnp.shape(f)} and {jnp.shape(g)}"
                 )
+                if FlagOp.concrete_true(f):
+                    # `True` is the identity for the flag conjunction, so the
+                    # existing mask can be reused as-is.
+                    return v
                 return Mask[R](value, FlagOp.and_(f, g))
             case _:
                 return Mask[R](v, f)
@@ -304,22 +308,25 @@ class Mask(Generic[R], Pytree):
             An Array of indices (-1, 0, or 1) indicating which value to select from each side.
         """
         # Note that the validation has already run to check that these flags have the same shape.
-        return first + 2 * FlagOp.and_(FlagOp.not_(first), second) - 1
+        # Two nested selects encode the table directly, instead of the not / and / scale / add / subtract chain.
+        return jnp.where(first, 0, jnp.where(second, 1, -1))
 
     def __or__(self, other: "Mask[R]") -> "Mask[R]":
-        self._validate_mask_shapes(other)
+        self.validate_mask_shapes(other)
 
         match self.primal_flag(), other.primal_flag():
             case True, _:
                 return self
             case False, _:
                 return other
+            case _, False:
+                return self
             case self_flag, other_flag:
                 idx = self._or_idx(self_flag, other_flag)
                 return tree_choose(idx, [self, other])
 
     def __xor__(self, other: "Mask[R]") -> "Mask[R]":
-        self._validate_mask_shapes(other)
+        self.validate_mask_shapes(other)
 
         match self.primal_flag(), other.primal_flag():
             case (False, False) | (True, True):
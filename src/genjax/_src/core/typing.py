@@ -58,7 +58,7 @@ Flag = bool | BoolArray
 # Trace-time-checked primitives #
 #################################
 
-ScalarShaped = Is[lambda arr: jnp.array(arr, copy=False).shape == ()]
+ScalarShaped = Is[lambda arr: jnp.ndim(arr) == 0]
 ScalarFlag = Annotated[Flag, ScalarShaped]
 ScalarInt = Annotated[IntArray, ScalarShaped]
 
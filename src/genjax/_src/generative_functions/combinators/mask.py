@@ -14,10 +14,8 @@
 
 
 import jax.numpy as jnp
-import jax.tree_util as jtu
 
 from genjax._src.core.compiler.interpreters.incremental import Diff
-from genjax._src.core.compiler.staging import FlagOp
 from genjax._src.core.generative import (
     Argdiffs,
     ChoiceMap,
@@ -200,56 +198,38 @@ class MaskCombinator(Generic[R], GenerativeFunction[Mask[R]]):
             key, original_trace, subrequest, inner_argdiffs
         )
 
-        final_trace: Trace[R] = jtu.tree_map(
-            lambda v1, v2: jnp.where(post_check, v1, v2),
-            premasked_trace,
-            original_trace,
-        )
-
-        t_to_t = FlagOp.and_(pre_check, post_check)
-        t_to_f = FlagOp.and_(pre_check, FlagOp.not_(post_check))
-        f_to_f = FlagOp.and_(FlagOp.not_(pre_check), FlagOp.not_(post_check))
-        f_to_t = FlagOp.and_(FlagOp.not_(pre_check), post_check)
-
-        final_weight = (
-            #       What's the math for the weight term here?
-            #
-            # Well, if we started with a "masked false trace",
-            # and then we flip the check_arg to True, we can re-use
-            # the sampling process which created the original trace as
-            # part of the move. The weight is the entire new trace's score.
-            #
-            # That's the transition False -> True:
-            #
-            #               final_weight = final_trace.score()
-            #
-            f_to_t * final_trace.get_score()
-            #
-            # On the other hand, if we started True, and went False, no matter
-            # the update, we can make the choice that this move is just removing
-            # the samples from the original trace, and ignoring the move.
-            #
-            # That's the transition True -> False:
-            #
-            #               final_weight = -original_trace.score()
-            #
-            + t_to_f * -original_trace.get_score()
-            #
-            # For the transition False -> False, we just ignore the move entirely.
-            #
-            #               final_weight = 0.0
-            #
-            + f_to_f * 0.0
-            #
-            # For the transition True -> True, we apply the move to the existing
-            # unmasked trace. In that case, the weight is just the weight of the move.
-            #
-            #               final_weight = weight
-            #
-            + t_to_t * weight
-            #
-            # In any case, we always apply the move... we're not avoiding
-            # that computation.
+        # What's the math for the weight term here?
+        #
+        # Well, if we started with a "masked false trace", and then we flip the
+        # check_arg to True, we can re-use the sampling process which created the
+        # original trace as part of the move. The weight is the entire new trace's
+        # score. That's the transition False -> True:
+        #
+        #               final_weight = premasked_trace.score()
+        #
+        # On the other hand, if we started True, and went False, no matter the
+        # update, we can make the choice that this move is just removing the samples
+        # from the original trace, and ignoring the move. That's the transition
+        # True -> False:
+        #
+        #               final_weight = -original_trace.score()
+        #
+        # For the transition False -> False, we just ignore the move entirely:
+        #
+        #               final_weight = 0.0
+        #
+        # For the transition True -> True, we apply the move to the existing unmasked
+        # trace. In that case, the weight is just the weight of the move:
+        #
+        #               final_weight = weight
+        #
+        # In any case, we always apply the move... we're not avoiding that
+        # computation. Selecting on the two flags (rather than summing flag-weighted
+        # terms) keeps an infinite score on a branch not taken from turning into NaN.
+        final_weight = jnp.where(
+            post_check,
+            jnp.where(pre_check, weight, premasked_trace.get_score()),
+            jnp.where(pre_check, -original_trace.get_score(), 0.0),
         )
 
         assert isinstance(bwd_request, Update)
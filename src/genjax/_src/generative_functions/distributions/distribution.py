@@ -13,12 +13,15 @@
 # limitations under the License.
 """This module contains the `Distribution` abstract base class."""
 
+import functools
 import textwrap
 import warnings
 from abc import abstractmethod
+from typing import cast
 
 import jax
 import jax.numpy as jnp
+import jax.tree_util as jtu
 from jax.experimental import checkify
 from tensorflow_probability.substrates import jax as tfp
 
@@ -44,6 +47,7 @@ from genjax._src.core.generative import (
 from genjax._src.core.pytree import Pytree
 from genjax._src.core.typing import (
     Any,
+    Array,
     Callable,
     Generic,
     PRNGKey,
@@ -130,14 +134,17 @@ class Distribution(Generic[R], GenerativeFunction[R]):
 
                 def _simulate(key, v):
                     score, new_v = self.random_weighted(key, *args)
-                    w = 0.0
+                    w = jnp.array(0.0)
                     return (score, w, new_v)
 
                 def _importance(key, v):
                     w = self.estimate_logpdf(key, v, *args)
                     return (w, w, v)
 
-                score, w, new_v = jax.lax.cond(flag, _importance, _simulate, key, value)
+                # A concrete flag picks its branch here, without staging the other.
+                score, w, new_v = FlagOp.cond(
+                    Diff.tree_primal(flag), _importance, _simulate, key, value
+                )
                 tr = DistributionTrace(self, args, new_v, score)
                 return tr, w
 
@@ -188,43 +195,34 @@ class Distribution(Generic[R], GenerativeFunction[R]):
             case ChoiceMap():
                 match constraint.get_value():
                     case Mask() as masked_value:
-
-                        def _true_branch(key, new_value: R, _):
-                            fwd = self.estimate_logpdf(key, new_value, *primals)
-                            bwd = trace.get_score()
-                            w = fwd - bwd
-                            return (new_value, w, fwd)
-
-                        def _false_branch(key, _, old_value: R):
-                            fwd = self.estimate_logpdf(key, old_value, *primals)
-                            bwd = trace.get_score()
-                            w = fwd - bwd
-                            return (old_value, w, fwd)
-
                         flag = masked_value.primal_flag()
-                        new_value: R = masked_value.value
-                        old_choices = trace.get_choices()
-                        old_value: R = old_choices.get_value()
-
-                        new_value, w, score = FlagOp.cond(
-                            flag,
-                            _true_branch,
-                            _false_branch,
-                            key,
-                            new_value,
-                            old_value,
-                        )
+                        old_value: R = trace.get_retval()
+
+                        # Both outcomes score a value against the new arguments, so
+                        # select the value first and evaluate the density once.
+                        if FlagOp.concrete_true(flag):
+                            new_value: R = masked_value.value
+                        elif FlagOp.concrete_false(flag):
+                            new_value = old_value
+                        else:
+                            new_value = jtu.tree_map(
+                                lambda v1, v2: jnp.where(flag, v1, v2),
+                                masked_value.value,
+                                old_value,
+                            )
+
+                        score = self.estimate_logpdf(key, new_value, *primals)
+                        w = score - trace.get_score()
                         return (
                             DistributionTrace(self, primals, new_value, score),
                             w,
                             Diff.unknown_change(new_value),
                             Update(
-                                old_choices.mask(flag),
+                                trace.get_choices().mask(flag),
                             ),
                         )
                     case None:
-                        value_chm = trace.get_choices()
-                        v = value_chm.get_value()
+                        v = trace.get_retval()
                         fwd = self.estimate_logpdf(key, v, *primals)
                         bwd = trace.get_score()
                         w = fwd - bwd
@@ -353,7 +351,18 @@ class Distribution(Generic[R], GenerativeFunction[R]):
 # ExactDensity #
 ################
 
-_fake_key = jnp.array([0, 0], dtype=jnp.uint32)
+# Only the shape and dtype of the key are seen by `jax.eval_shape`, so an abstract
+# value avoids materializing a device buffer at import time. It stands in for a
+# `PRNGKey` in the traced calls, hence the cast.
+_fake_key = cast(PRNGKey, jax.ShapeDtypeStruct((2,), jnp.uint32))
+
+
+def _total_logpdf(w: Array) -> Score:
+    """Sums a (possibly array-valued) log density down to a scalar score."""
+    if w.shape:
+        return jnp.sum(w)
+    else:
+        return w
 
 
 class ExactDensity(Generic[R], Distribution[R]):
@@ -389,11 +398,7 @@ class ExactDensity(Generic[R], Distribution[R]):
         """
         Given a sample and arguments to the distribution, return the exact log density of the sample.
         """
-        w = self.logpdf(v, *args)
-        if w.shape:
-            return jnp.sum(w)
-        else:
-            return w
+        return _total_logpdf(self.logpdf(v, *args))
 
     def assess(
         self,
@@ -419,6 +424,7 @@ class ExactDensity(Generic[R], Distribution[R]):
                 return w, v
 
 
+@functools.lru_cache(maxsize=256)
 def canonicalize_distribution_name(s: str) -> str:
     """Converts underlying distribution name from CamelCase to snake_case
     and prepends `genjax.`"""
@@ -434,13 +440,21 @@ def canonicalize_distribution_name(s: str) -> str:
 
 
 def exact_density(
-    sample: Callable[..., R], logpdf: Callable[..., Score], name: str | None = None
+    sample: Callable[..., R],
+    logpdf: Callable[..., Score],
+    name: str | None = None,
+    sample_and_logpdf: Callable[..., tuple[R, Score]] | None = None,
 ) -> ExactDensity[R]:
     """Construct a new type, a subclass of ExactDensity, with the given name,
     (with `genjax.` prepended, to avoid confusion with the underlying object,
     which may not share the same interface) and attach the supplied functions
     as the `sample` and `logpdf` methods. The return value is an instance of
-    this new type, and should be treated as a singleton."""
+    this new type, and should be treated as a singleton.
+
+    If `sample_and_logpdf` is supplied, it should return a `(sample, logpdf)` pair
+    for the same arguments as `sample`; `random_weighted` then uses it in place of
+    separate `sample` and `logpdf` calls, which lets the two share any work spent
+    setting up the distribution."""
     if name is None:
         warnings.warn("You should supply a name argument to exact_density")
         name = "unknown"
@@ -461,17 +475,21 @@ def exact_density(
         else:
             return f(a0, *args, **kwargs)
 
-    T = type(
-        canonicalize_distribution_name(name),
-        (ExactDensity,),
-        {
-            "sample": lambda self, key, *args, **kwargs: kwargle(
-                sample, key, args, kwargs
-            ),
-            "logpdf": lambda self, v, *args, **kwargs: kwargle(logpdf, v, args, kwargs),
-            "handle_kwargs": lambda self: self,
-        },
-    )
+    methods: dict[str, Callable[..., Any]] = {
+        "sample": lambda self, key, *args, **kwargs: kwargle(sample, key, args, kwargs),
+        "logpdf": lambda self, v, *args, **kwargs: kwargle(logpdf, v, args, kwargs),
+        "handle_kwargs": lambda self: self,
+    }
+    if sample_and_logpdf is not None:
+        f = sample_and_logpdf
+
+        def random_weighted(self, key, *args, **kwargs):
+            v, w = kwargle(f, key, args, kwargs)
+            return _total_logpdf(w), v
+
+        methods["random_weighted"] = random_weighted
+
+    T = type(canonicalize_distribution_name(name), (ExactDensity,), methods)
 
     return Pytree.dataclass(T)()
 
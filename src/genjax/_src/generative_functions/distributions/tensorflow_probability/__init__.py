@@ -61,7 +61,16 @@ def tfp_distribution(
 
         return d.log_prob(v)
 
-    return exact_density(sampler, logpdf, name or dist.__name__)
+    def sampler_and_logpdf(key, *args, **kwargs):
+        # Builds the distribution once for both the draw and its density.
+        sample_shape = kwargs.pop("sample_shape", ())
+        d = dist(*args, **kwargs)
+        v = d.sample(seed=key, sample_shape=Const.unwrap(sample_shape))
+        return v, d.log_prob(v)
+
+    return exact_density(
+        sampler, logpdf, name or dist.__name__, sample_and_logpdf=sampler_and_logpdf
+    )
 
 
 #####################
@@ -246,6 +255,13 @@ mv_normal = tfp_distribution(tfd.MultivariateNormalFullCovariance)
 A `tfp_distribution` generative function which wraps the [`tfd.MultivariateNormalFullCovariance`](https://www.tensorflow.org/probability/api_docs/python/tfp/distributions/MultivariateNormalFullCovariance) distribution from TensorFlow Probability distributions.
 """
 
+mv_normal_tril = tfp_distribution(tfd.MultivariateNormalTriL)
+"""
+A `tfp_distribution` generative function which wraps the [`tfd.MultivariateNormalTriL`](https://www.tensorflow.org/probability/api_docs/python/tfp/distributions/MultivariateNormalTriL) distribution from TensorFlow Probability distributions.
+
+Takes a location and a lower-triangular `scale_tril` with `covariance = scale_tril @ scale_tril.T`. Unlike `mv_normal`, which factors its covariance on every call, a Cholesky factor computed once (e.g. `jnp.linalg.cholesky(cov)`) can be shared across many calls.
+"""
+
 negative_binomial = tfp_distribution(tfd.NegativeBinomial)
 """
 A `tfp_distribution` generative function which wraps the [`tfd.NegativeBinomial`](https://www.tensorflow.org/probability/api_docs/python/tfp/distributions/NegativeBinomial) distribution from TensorFlow Probability distributions.
@@ -817,12 +817,17 @@ class StaticGenerativeFunction(Generic[R], GenerativeFunction[R]):
     ) -> Weight:
         assert isinstance(trace, StaticTrace)
 
-        weight = jnp.array(0.0)
-        for addr in trace.subtraces.keys():
-            subprojection = selection(addr)
-            subtrace = trace.get_subtrace(addr)
-            weight += subtrace.project(key, subprojection)
-        return weight
+        if not trace.subtraces:
+            return jnp.array(0.0)
+
+        # One split provides a distinct key per address, and stacking the per-address
+        # projections gives a single reduction, rather than a chain of scalar adds.
+        sub_keys = jax.random.split(key, len(trace.subtraces))
+        weights = [
+            subtrace.project(sub_key, selection(addr))
+            for sub_key, (addr, subtrace) in zip(sub_keys, trace.subtraces.items())
+        ]
+        return jnp.sum(jnp.stack(weights))
 
     def edit_update(
         self,
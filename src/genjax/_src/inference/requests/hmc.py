@@ -88,9 +88,7 @@ def selection_gradient(
         return weight
 
     return grad_tree_zip(grad_tree, nongrad_tree), jtu.tree_map(
-        lambda v1, v2: v1
-        if v1 is not None
-        else jnp.zeros_like(jnp.array(v2, copy=False)),
+        lambda v1, v2: v1 if v1 is not None else jnp.zeros_like(v2),
         grad(differentiable_assess)(grad_tree),
         nongrad_tree,
     )
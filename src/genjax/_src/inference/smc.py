@@ -18,10 +18,10 @@ In this module, we provide a set of ingredients for implementing SMC algorithms,
 
 from abc import abstractmethod
 
+from jax import lax, vmap
 from jax import numpy as jnp
 from jax import random as jrandom
 from jax import tree_util as jtu
-from jax import vmap
 from jax.scipy.special import logsumexp
 
 from genjax._src.core.generative import (
@@ -36,6 +36,7 @@ from genjax._src.core.typing import (
     BoolArray,
     FloatArray,
     Generic,
+    IntArray,
     PRNGKey,
     TypeVar,
 )
@@ -93,6 +94,15 @@ class ParticleCollection(Generic[R], Pytree):
     def get_log_weights(self) -> FloatArray:
         return self.log_weights
 
+    def get_normalized_log_weights(self) -> FloatArray:
+        return self.log_weights - logsumexp(self.log_weights)
+
+    def get_effective_sample_size(self) -> FloatArray:
+        """
+        Returns the effective sample size `1 / sum(w_i^2)` of the normalized weights, computed in log space so it stays finite when the unnormalized log weights are very large or very small.
+        """
+        return jnp.exp(-logsumexp(2 * self.get_normalized_log_weights()))
+
     def get_log_marginal_likelihood_estimate(self) -> FloatArray:
         return logsumexp(self.log_weights) - jnp.log(len(self.log_weights))
 
@@ -103,8 +113,7 @@ class ParticleCollection(Generic[R], Pytree):
         """
         Samples a particle from the collection, with probability proportional to its weight.
         """
-        log_weights = self.get_log_weights()
-        logits = log_weights - logsumexp(log_weights)
+        logits = self.get_normalized_log_weights()
         _, idx = categorical.random_weighted(key, logits)
         return self.get_particle(idx)
 
@@ -296,8 +305,7 @@ class ImportanceK(Generic[R], SMCAlgorithm[R]):
         return self.target
 
     def run_smc(self, key: PRNGKey):
-        key, sub_key = jrandom.split(key)
-        sub_keys = jrandom.split(sub_key, self.get_num_particles())
+        sub_keys = jrandom.split(key, self.get_num_particles())
         if self.q is not None:
             log_weights, choices = vmap(self.q.random_weighted, in_axes=(0, None))(
                 sub_keys, self.target
@@ -315,8 +323,8 @@ class ImportanceK(Generic[R], SMCAlgorithm[R]):
         )
 
     def run_csmc(self, key: PRNGKey, retained: ChoiceMap):
-        key, sub_key = jrandom.split(key)
-        sub_keys = jrandom.split(sub_key, self.get_num_particles() - 1)
+        keys = jrandom.split(key, self.get_num_particles())
+        key, sub_keys = keys[0], keys[1:]
         if self.q:
             log_scores, choices = vmap(self.q.random_weighted, in_axes=(0, None))(
                 sub_keys, self.target
@@ -351,6 +359,90 @@ class ImportanceK(Generic[R], SMCAlgorithm[R]):
         )
 
 
+##############
+# Resampling #
+##############
+
+
+def systematic_resample(key: PRNGKey, log_weights: FloatArray) -> IntArray:
+    """Returns `N` ancestor indices drawn by systematic resampling from the
+    unnormalized `log_weights`, using a single uniform draw shared by all strata."""
+    n = log_weights.shape[0]
+    weights = jnp.exp(log_weights - logsumexp(log_weights))
+    # A work-efficient parallel prefix sum: O(log N) depth rather than the
+    # sequential pass `jnp.cumsum` lowers to on some backends.
+    cdf = lax.associative_scan(jnp.add, weights)
+    us = (jrandom.uniform(key) + jnp.arange(n)) / n
+    # Guard against `cdf[-1]` rounding to slightly less than 1.
+    return jnp.minimum(jnp.searchsorted(cdf, us), n - 1)
+
+
+@Pytree.dataclass
+class Resample(Generic[R], SMCAlgorithm[R]):
+    """Given a previous SMC algorithm `prev`, resample its particles with systematic resampling whenever their effective sample size falls below `ess_threshold` times the number of particles.
+
+    After resampling, every particle carries the average weight of the collection (in log space, `logsumexp(w) - log(N)`), so the log marginal likelihood estimate is unchanged. Otherwise, the collection is returned as is.
+
+    In `run_csmc`, the retained particle (the last one) is always kept as its own ancestor, and the ancestors of the other `N - 1` particles are drawn independently from the weights (multinomial resampling). Systematic resampling can't be used there: its strata are coupled through a single uniform draw, so pinning the last ancestor would leave the remaining ones with the wrong conditional distribution.
+    """
+
+    prev: SMCAlgorithm[R]
+    ess_threshold: float = Pytree.static(default=0.5)
+
+    def get_num_particles(self):
+        return self.prev.get_num_particles()
+
+    def get_final_target(self):
+        return self.prev.get_final_target()
+
+    def _resample(
+        self,
+        key: PRNGKey,
+        collection: ParticleCollection[R],
+        conditional: bool,
+    ) -> ParticleCollection[R]:
+        log_weights = collection.get_log_weights()
+        n = log_weights.shape[0]
+        ess = collection.get_effective_sample_size()
+        should_resample = ess < self.ess_threshold * n
+
+        if conditional:
+            free_idxs = jrandom.categorical(key, log_weights, shape=(n - 1,))
+            idxs = jnp.append(free_idxs, n - 1)
+        else:
+            idxs = systematic_resample(key, log_weights)
+        idxs = jnp.where(should_resample, idxs, jnp.arange(n))
+        new_log_weights = jnp.where(
+            should_resample,
+            jnp.full_like(
+                log_weights, collection.get_log_marginal_likelihood_estimate()
+            ),
+            log_weights,
+        )
+        return ParticleCollection(
+            collection.get_particle(idxs),
+            new_log_weights,
+            collection.is_valid,
+        )
+
+    def run_smc(
+        self,
+        key: PRNGKey,
+    ) -> ParticleCollection[R]:
+        key, sub_key = jrandom.split(key)
+        collection = self.prev.run_smc(sub_key)
+        return self._resample(key, collection, conditional=False)
+
+    def run_csmc(
+        self,
+        key: PRNGKey,
+        retained: ChoiceMap,
+    ) -> ParticleCollection[R]:
+        key, sub_key = jrandom.split(key)
+        collection = self.prev.run_csmc(sub_key, retained)
+        return self._resample(key, collection, conditional=True)
+
+
 #################
 # Change target #
 #################
@@ -55,6 +55,7 @@ from genjax._src.generative_functions.distributions.tensorflow_probability impor
     multinomial,
     mv_normal,
     mv_normal_diag,
+    mv_normal_tril,
     negative_binomial,
     non_central_chi2,
     normal,
@@ -111,6 +112,7 @@ __all__ = [
     "multinomial",
     "mv_normal",
     "mv_normal_diag",
+    "mv_normal_tril",
     "negative_binomial",
     "non_central_chi2",
     "normal",
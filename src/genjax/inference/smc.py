@@ -16,6 +16,7 @@ from genjax._src.inference.smc import (
     ChangeTarget,
     Importance,
     ImportanceK,
+    Resample,
     SMCAlgorithm,
 )
 
@@ -23,5 +24,6 @@ __all__ = [
     "ChangeTarget",
     "Importance",
     "ImportanceK",
+    "Resample",
     "SMCAlgorithm",
 ]
@@ -28,6 +28,7 @@ from genjax import ChoiceMapBuilder as C
 from genjax import SelectionBuilder as S
 from genjax._src.core.generative.choice_map import (
     ChoiceMapNoValueAtAddress,
+    Indexed,
     Static,
     StaticAddress,
     Switch,
@@ -157,6 +158,10 @@ class TestSelections:
         assert sel1 & sel1 == sel1
         assert sel2 & sel2 == sel2
 
+        # complement absorption
+        assert sel1 & ~sel1 == none_sel
+        assert ~sel1 & sel1 == none_sel
+
     def test_selection_or(self):
         sel1 = S["x"]
         sel2 = S["y"]
@@ -180,6 +185,19 @@ class TestSelections:
         assert sel1 | sel1 == sel1
         assert sel2 | sel2 == sel2
 
+        # complement absorption
+        assert sel1 | ~sel1 == all_sel
+        assert ~sel1 | sel1 == all_sel
+
+        # static addresses are merged into a single dispatch
+        flat_sel = S["x"] | S["y", "a"] | S["y", "b"]
+        assert flat_sel == S["y", "b"] | S["y", "a"] | S["x"]
+        assert flat_sel["x"]
+        assert flat_sel["y", "a"]
+        assert flat_sel["y", "b"]
+        assert not flat_sel["y"]
+        assert not flat_sel["y", "c"]
+
     def test_selection_filter(self):
         # Create a ChoiceMap
         chm = ChoiceMap.kw(x=1, y=2, z=3)
@@ -259,6 +277,14 @@ class TestSelections:
         with pytest.raises(TypeError):
             sel["a", ..., ...]  # pyright: ignore
 
+        # components after an early `AllSel` / `NoneSel` exit are still checked
+        with pytest.raises(TypeError):
+            Selection.all()["a", ...]  # pyright: ignore
+        with pytest.raises(TypeError):
+            Selection.none()["a", ...]  # pyright: ignore
+        with pytest.raises(TypeError):
+            S["a"]["b", ...]  # pyright: ignore
+
     def test_static_sel(self):
         xy_sel = Selection.at["x", "y"]
         assert not xy_sel[()]
@@ -706,6 +732,56 @@ class TestChoiceMap:
         assert jnp.array_equal(chm[0, "x"].primal_flag(), jnp.asarray(False))
         assert jnp.array_equal(chm[11, "x"].primal_flag(), jnp.asarray(False))
 
+    def test_or_stacks_indexed(self):
+        chm1 = C["x", jnp.array([0, 1])].set(jnp.array([1.0, 2.0]))
+        chm2 = C["x", jnp.array(2)].set(jnp.array(3.0))
+
+        # sibling dynamic entries are stored in a single address array
+        chm = chm1 | chm2
+        assert isinstance(chm("x"), Indexed)
+        assert chm["x", 0] == genjax.Mask(1.0, True)
+        assert chm["x", 1] == genjax.Mask(2.0, True)
+        assert chm["x", 2] == genjax.Mask(3.0, True)
+        assert jnp.array_equal(chm["x", 3].primal_flag(), jnp.asarray(False))
+
+        # earlier entries keep priority
+        chm3 = C["x", jnp.array(1)].set(jnp.array(5.0))
+        assert (chm1 | chm3)["x", 1] == genjax.Mask(2.0, True)
+        assert (chm3 | chm1)["x", 1] == genjax.Mask(5.0, True)
+
+        # entries of different shapes are left as an `Or`
+        chm4 = C["x", jnp.array(3)].set(jnp.ones(2))
+        assert not isinstance((chm1 | chm4)("x"), Indexed)
+
+        # leaves whose leading dimension doesn't match the address length are
+        # left as an `Or`, rather than misaligning values and addresses
+        chm5 = C["x", jnp.array([0, 1])].set(jnp.array([1.0, 2.0, 9.0]))
+        chm = chm5 | chm2
+        assert not isinstance(chm("x"), Indexed)
+        assert chm["x", 2] == genjax.Mask(3.0, True)
+
+        chm6 = C["x", jnp.array([0, 1])].set(jnp.array(7.0))
+        assert not isinstance((chm6 | chm2)("x"), Indexed)
+
+    def test_or_of_vmapped_indexed(self):
+        # Addresses are 0-d inside the vmap body but batched afterwards, so traced
+        # `Indexed` operands must not be stacked.
+        chm = jax.vmap(lambda i, j, a, b: C["x", i].set(a) | C["x", j].set(b))(
+            jnp.array([0, 1, 2]),
+            jnp.array([3, 4, 5]),
+            jnp.array([1.0, 2.0, 3.0]),
+            jnp.array([4.0, 5.0, 6.0]),
+        )
+        assert not isinstance(chm("x"), Indexed)
+
+        first = jax.vmap(lambda c, i: c["x", i])(chm, jnp.array([0, 1, 2]))
+        assert jnp.array_equal(first.value, jnp.array([1.0, 2.0, 3.0]))
+        assert jnp.array_equal(first.primal_flag(), jnp.array([True, True, True]))
+
+        second = jax.vmap(lambda c, j: c["x", j])(chm, jnp.array([3, 4, 5]))
+        assert jnp.array_equal(second.value, jnp.array([4.0, 5.0, 6.0]))
+        assert jnp.array_equal(second.primal_flag(), jnp.array([True, True, True]))
+
     def test_merge(self):
         chm1 = ChoiceMap.kw(x=1)
         chm2 = ChoiceMap.kw(y=2)
@@ -45,6 +45,17 @@ class TestFlag:
             for f2 in false_flags:
                 assert not jnp.all(FlagOp.xor_(f1, f2))
 
+    def test_identity_operands(self):
+        flag = jnp.array([True, False])
+        assert FlagOp.and_(True, flag) is flag
+        assert FlagOp.and_(flag, True) is flag
+        assert FlagOp.or_(False, flag) is flag
+        assert FlagOp.xor_(flag, False) is flag
+
+        # absorbing constants still broadcast against the array operand
+        assert jnp.array_equal(FlagOp.and_(False, flag), jnp.array([False, False]))
+        assert jnp.array_equal(FlagOp.or_(flag, True), jnp.array([True, True]))
+
     def test_where(self):
         assert FlagOp.where(True, 3.0, 4.0) == 3
         assert FlagOp.where(False, 3.0, 4.0) == 4
@@ -27,6 +27,13 @@ class TestDistributions:
         tr = genjax.normal(0.0, 1.0).simulate(key, ())
         assert tr.get_score() == genjax.normal(0.0, 1.0).assess(tr.get_choices(), ())[0]
 
+    def test_simulate_with_kwargs(self):
+        key = jax.random.key(314159)
+        dist = genjax.normal(loc=0.0, scale=1.0, sample_shape=genjax.Const((3,)))
+        tr = dist.simulate(key, ())
+        assert tr.get_retval().shape == (3,)
+        assert tr.get_score() == dist.assess(tr.get_choices(), ())[0]
+
     def test_importance(self):
         key = jax.random.key(314159)
 
@@ -472,6 +479,17 @@ class TestDistributions:
         key = jax.random.key(314159)
         _ = model.simulate(key, ())
 
+    def test_mv_normal_tril_matches_mv_normal(self):
+        loc = jnp.array([0.5, -1.0])
+        cov = jnp.array([[2.0, 0.3], [0.3, 1.0]])
+        chm = C.set(jnp.array([0.1, 0.2]))
+
+        score, _ = genjax.mv_normal(loc, cov).assess(chm, ())
+        tril_score, _ = genjax.mv_normal_tril(loc, jnp.linalg.cholesky(cov)).assess(
+            chm, ()
+        )
+        assert jnp.allclose(score, tril_score)
+
     def test_distribution_repr(self):
         @genjax.gen
         def model():
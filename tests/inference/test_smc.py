@@ -19,8 +19,10 @@ from jax.scipy.special import logsumexp
 
 import genjax
 from genjax import ChoiceMapBuilder as C
+from genjax import Pytree
 from genjax import SelectionBuilder as S
 from genjax._src.core.typing import Any
+from genjax._src.inference.smc import ParticleCollection
 from genjax._src.inference.sp import Target
 
 
@@ -28,6 +30,27 @@ def logpdf(v):
     return lambda c, *args: v.assess(C.v(c), args)[0]
 
 
+@Pytree.dataclass
+class FixedCollection(genjax.inference.smc.SMCAlgorithm[Any]):
+    """Returns the same particle collection whatever the key, so that tests of
+    downstream steps don't depend on how those steps split their keys."""
+
+    target: Target[Any]
+    collection: ParticleCollection[Any]
+
+    def get_num_particles(self):
+        return len(self.collection.get_log_weights())
+
+    def get_final_target(self):
+        return self.target
+
+    def run_smc(self, key):
+        return self.collection
+
+    def run_csmc(self, key, retained):
+        return self.collection
+
+
 class TestSMC:
     def test_exact_flip_flip_trivial(self):
         @genjax.gen
@@ -86,6 +109,66 @@ class TestSMC:
         Z_exact = flip_flip_exact_log_marginal_density(inference_problem)
         assert Z_est == pytest.approx(Z_exact, 1e-1)
 
+    def test_resample_preserves_marginal_likelihood(self):
+        @genjax.gen
+        def flip_flip():
+            v1 = genjax.flip(0.5) @ "x"
+            p = jax.lax.cond(v1, lambda: 0.9, lambda: 0.3)
+            _ = genjax.flip(p) @ "y"
+
+        key = jax.random.key(314159)
+        inference_problem = genjax.Target(flip_flip, (), C["y"].set(False))
+        importance = genjax.inference.smc.ImportanceK(
+            inference_problem, k_particles=2000
+        )
+        before = importance.run_smc(key)
+        prev = FixedCollection(inference_problem, before)
+
+        # Always resample: every particle ends up with the average weight, and
+        # the log marginal likelihood estimate is preserved.
+        resampled = genjax.inference.smc.Resample(prev, ess_threshold=1.0)
+        collection = jax.jit(resampled.run_smc)(key)
+        log_weights = collection.get_log_weights()
+        assert jnp.allclose(log_weights, log_weights[0])
+        assert collection.get_effective_sample_size() == pytest.approx(2000, 1e-4)
+        expected = logsumexp(before.get_log_weights()) - jnp.log(2000)
+        assert collection.get_log_marginal_likelihood_estimate() == pytest.approx(
+            expected, 1e-4
+        )
+
+        # Never resample: the collection is unchanged.
+        untouched = genjax.inference.smc.Resample(prev, ess_threshold=0.0)
+        assert jnp.array_equal(
+            untouched.run_smc(key).get_log_weights(), before.get_log_weights()
+        )
+
+    def test_conditional_resample_keeps_retained_particle(self):
+        @genjax.gen
+        def flip_flip():
+            v1 = genjax.flip(0.5) @ "x"
+            p = jax.lax.cond(v1, lambda: 0.9, lambda: 0.3)
+            _ = genjax.flip(p) @ "y"
+
+        key = jax.random.key(314159)
+        inference_problem = genjax.Target(flip_flip, (), C["y"].set(False))
+        importance = genjax.inference.smc.ImportanceK(
+            inference_problem, k_particles=100
+        )
+        retained = C["x"].set(True)
+        before = importance.run_csmc(key, retained)
+        prev = FixedCollection(inference_problem, before)
+
+        resampled = genjax.inference.smc.Resample(prev, ess_threshold=1.0)
+        for sub_key in jax.random.split(key, 5):
+            collection = jax.jit(resampled.run_csmc)(sub_key, retained)
+            last = collection.get_particle(-1).get_choices()
+            assert last["x"] == retained["x"]
+            log_weights = collection.get_log_weights()
+            assert jnp.allclose(log_weights, log_weights[0])
+            assert collection.get_log_marginal_likelihood_estimate() == pytest.approx(
+                before.get_log_marginal_likelihood_estimate(), 1e-4
+            )
+
     def test_non_marginal_target(self):
         @genjax.gen
         def model():